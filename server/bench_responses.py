@@ -0,0 +1,81 @@
+"""Measure /assess response size and encode time, separating the body change from the encoder change.
+
+Bodies come from build_assess_response (the code path /assess uses), fed by the saved reports in
+reports.json that still carry an `ai_raw` envelope.
+Run from the server/ folder:  python bench_responses.py
+"""
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+
+from main import build_assess_response, load_reports, orjson, render_json, synthesize_report
+
+
+def stdlib_encode(obj):
+    # FastAPI's JSONResponse.render
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def old_encode(obj):
+    # what /assess did before: jsonable_encoder + JSONResponse.render
+    return stdlib_encode(jsonable_encoder(obj))
+
+
+def assess_body(report, include_raw):
+    child = report['child']
+    answers = report.get('answers') or child.get('answers') or []
+    final_ai = synthesize_report(report['ai_structured'], report['scores'], child, answers)
+    return build_assess_response(report['scores'], final_ai, report['ai_raw'], include_raw)
+
+
+def measure(encode, bodies, n):
+    size = sum(len(encode(b)) for b in bodies) / len(bodies)
+    per_call = timeit.timeit(lambda: [encode(b) for b in bodies], number=n) / (n * len(bodies))
+    return size, per_call
+
+
+def main():
+    reports = [r for r in load_reports() if r.get('ai_raw') and r.get('ai_structured')]
+    if not reports:
+        print("no reports with ai_raw/ai_structured in reports.json")
+        return
+
+    full = [assess_body(r, True) for r in reports]
+    lean = [assess_body(r, False) for r in reports]
+    n = 200
+    fast_name = "orjson" if orjson else "json (orjson not installed)"
+
+    rows = [
+        ("full body, jsonable_encoder + json (before)", old_encode, full),
+        ("full body, json", stdlib_encode, full),
+        (f"full body, {fast_name}", render_json, full),
+        ("lean body, json", stdlib_encode, lean),
+        (f"lean body, {fast_name} (now)", render_json, lean),
+    ]
+    print(f"reports sampled: {len(reports)}")
+    results = []
+    for label, encode, bodies in rows:
+        size, per_call = measure(encode, bodies, n)
+        results.append((size, per_call))
+        print(f"{label:<46} {size:8.0f} bytes  {per_call * 1e6:8.1f} us/request")
+
+    (before_size, before_t), (_, full_json_t), (_, full_fast_t) = results[:3]
+    lean_size, now_t = results[4]
+    print(f"dropping raw_ai: size -{(1 - lean_size / before_size) * 100:.0f}%")
+    print(f"encoder only (full body): json -> {fast_name} -{(1 - full_fast_t / full_json_t) * 100:.0f}%; "
+          f"skipping jsonable_encoder -{(1 - full_json_t / before_t) * 100:.0f}%")
+    print(f"encode step only: -{(1 - now_t / before_t) * 100:.0f}%")
+
+    # /assess now also validates the lean body through AssessmentOut; that is part of the per-request cost
+    inputs = [(r['scores'], synthesize_report(r['ai_structured'], r['scores'], r['child'], r.get('answers') or []), r['ai_raw'])
+              for r in reports]
+    build_t = timeit.timeit(lambda: [build_assess_response(s, f, a, False) for s, f, a in inputs], number=n) / (n * len(inputs))
+    total_t = build_t + now_t
+    print(f"AssessmentOut validation (build_assess_response): {build_t * 1e6:.1f} us/request")
+    print(f"per request, validation + encode: {total_t * 1e6:.1f} us vs {before_t * 1e6:.1f} us before "
+          f"(-{(1 - total_t / before_t) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Shared fixtures: every test gets its own reports.json, render cache and empty in-process caches."""
+import json
+from collections import OrderedDict
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def initial_reports():
+    # override in a test module to seed reports.json
+    return []
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, initial_reports):
+    reports_file = tmp_path / "reports.json"
+    if initial_reports:
+        reports_file.write_text(json.dumps(initial_reports), encoding="utf-8")
+    monkeypatch.setattr(main, "REPORTS_FILE", str(reports_file))
+    monkeypatch.setattr(main, "RENDER_DIR", str(tmp_path / "rendered"))
+    monkeypatch.setattr(main, "_report_etags", {})
+    monkeypatch.setattr(main, "_report_etags_stamp", None)
+    monkeypatch.setattr(main, "_compressed_cache", OrderedDict())
+    return TestClient(main.app)
@@ -1,23 +1,77 @@
 import os
+import re
 import json
 import time
-from typing import List, Dict, Any
-
-from fastapi import FastAPI, HTTPException
+import gzip
+import html
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from string import Template
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import requests
 from dotenv import load_dotenv
 
 from questions import QUESTIONS, OPTIONS, PILLAR_WEIGHTS
 
+try:
+    import brotli
+except ImportError:
+    # brotli is optional; responses fall back to gzip without it
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; render_json falls back to the stdlib encoder
+    orjson = None
+
+try:
+    from weasyprint import HTML as WeasyHTML
+except ImportError:
+    # weasyprint is optional; without it only ?format=html can be rendered
+    WeasyHTML = None
+
 load_dotenv()
 
 # read the API key from environment
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 REPORTS_FILE = os.path.join(os.path.dirname(__file__), "reports.json")
 
-app = FastAPI(title="CARES MVP API")
+# HTTP caching / compression settings for the report endpoints
+COMPRESS_MIN_BYTES = 1024
+COMPRESSED_CACHE_MAX_ENTRIES = 256
+REPORT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+LISTING_CACHE_CONTROL = "private, no-cache"
+
+# Server-side report rendering: template compiled once, output cached on disk by content key
+TEMPLATE_FILE = os.path.join(os.path.dirname(__file__), "templates", "report.html")
+RENDER_DIR = os.path.join(os.path.dirname(__file__), "rendered")
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+RENDER_MEDIA_TYPES = {"html": "text/html", "pdf": "application/pdf"}
+
+
+def render_json(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    # same encoding FastAPI's JSONResponse uses
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+app = FastAPI(title="CARES MVP API", default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +94,57 @@ class AssessmentIn(BaseModel):
     answers: List[Answer]
 
 
+class Scores(BaseModel):
+    pillar_percentages: Dict[str, float]
+    overall_score: float
+    category: str
+    red_flags: List[str]
+    risks: Dict[str, int]
+
+
+class Resource(BaseModel):
+    title: str
+    url: str = ""
+
+
+class AssessmentOut(BaseModel):
+    score: float
+    category: str
+    header_summary: str
+    professional_paragraph: str
+    observations: List[str]
+    why_this_matters: str
+    improvement_plan: Dict[str, List[str]]
+    recommended_family_rules: List[str]
+    follow_up: Dict[str, Any]
+    monitor_confidence: float
+    counselor_notes: str
+    suggested_resources: List[Resource]
+    pillars: Dict[str, float]
+    risks: Dict[str, int]
+    red_flags: List[str]
+    # only present with ?include=raw
+    raw_ai: Optional[Dict[str, Any]]
+
+
+class ReportOut(BaseModel):
+    id: int
+    timestamp: float
+    child: Dict[str, Any]
+    answers: Optional[List[Answer]]
+    scores: Scores
+    # reports saved when the model call failed carry `ai: null` and no ai_* fields
+    ai: Optional[Any]
+    ai_parsed: Optional[Any]
+    ai_structured: Optional[Dict[str, Any]]
+    # only present with ?include=raw
+    ai_raw: Optional[Dict[str, Any]]
+
+
+def wants_raw(include: Optional[str]) -> bool:
+    return bool(include) and "raw" in [p.strip() for p in include.split(",")]
+
+
 def ensure_reports_file():
     if not os.path.exists(REPORTS_FILE):
         with open(REPORTS_FILE, "w", encoding="utf-8") as f:
@@ -53,10 +158,318 @@ def load_reports() -> List[Dict[str, Any]]:
 
 
 def save_report(obj: Dict[str, Any]):
+    global _report_etags_stamp
+    # one writer at a time: concurrent saves would otherwise lose reports on disk or in the ETag index
+    with _save_lock:
+        before = reports_stamp()
+        reps = load_reports()
+        reps.append(obj)
+        with open(REPORTS_FILE, "w", encoding="utf-8") as f:
+            json.dump(reps, f, indent=2)
+        # if the ETag index was current before this write, extend it instead of re-reading the file
+        with _cache_lock:
+            if _report_etags_stamp == before:
+                _report_etags[obj.get('id')] = report_etag(obj)
+                _report_etags_stamp = reports_stamp()
+
+
+def reports_stamp() -> Tuple[int, int]:
+    """(mtime_ns, size) of reports.json; changes whenever any process rewrites the file."""
+    try:
+        st = os.stat(REPORTS_FILE)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+# report id -> strong ETag (id + content hash); lets /reports/{id} answer 304 without reading storage.
+# Valid for the reports.json stamp it was built from.
+_report_etags: Dict[int, str] = {}
+_report_etags_stamp: Optional[Tuple[int, int]] = None
+# (etag, accepted encoding) -> (body bytes, content-encoding or None), LRU-bounded
+_compressed_cache: "OrderedDict[Tuple[str, str], Tuple[bytes, Optional[str]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_save_lock = threading.Lock()
+
+
+def report_etag(report: Dict[str, Any]) -> str:
+    digest = hashlib.sha256(json.dumps(report, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return f'"{report.get("id")}-{digest}"'
+
+
+def raw_variant_etag(etag: str) -> str:
+    # the ?include=raw representation of a report is a different body, so it gets its own ETag
+    return '"{}-raw"'.format(etag.strip('"'))
+
+
+def listing_etag() -> str:
+    mtime_ns, size = reports_stamp()
+    return f'"reports-{mtime_ns}-{size}"'
+
+
+def known_report_etags() -> Dict[int, str]:
+    """ETags for every stored report; rebuilt (one read) only when reports.json changed on disk."""
+    global _report_etags, _report_etags_stamp
+    stamp = reports_stamp()
+    if stamp != _report_etags_stamp:
+        etags = {r.get('id'): report_etag(r) for r in load_reports()} if stamp != (0, 0) else {}
+        with _cache_lock:
+            _report_etags, _report_etags_stamp = etags, stamp
+    return _report_etags
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    # each negotiated content-coding is its own representation, so it gets its own strong ETag
+    if encoding == "identity":
+        return etag
+    return '"{}-{}"'.format(etag.strip('"'), encoding)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against an ETag (and its encoded variants)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    base = etag.strip('"')
+    accepted = {base, f"{base}-gzip", f"{base}-br"}
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"') in accepted:
+            return True
+    return False
+
+
+def pick_encoding(request: Request) -> str:
+    """Choose br/gzip/identity from Accept-Encoding (br only when the brotli package is installed)."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+
+def encode_body(raw: bytes, encoding: str) -> Tuple[bytes, Optional[str]]:
+    if len(raw) < COMPRESS_MIN_BYTES or encoding == "identity":
+        return raw, None
+    if encoding == "br":
+        return brotli.compress(raw), "br"
+    return gzip.compress(raw, compresslevel=6), "gzip"
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"})
+
+
+def cached_json_response(request: Request, etag: str, cache_control: str, build: Callable[[], Any]) -> Response:
+    """Serve a JSON body for `etag`: 304 on a matching If-None-Match, else a cached pre-compressed copy.
+
+    `build` is only called (and storage only read) on a cache miss.
+    """
+    encoding = pick_encoding(request)
+    tag = encoded_etag(etag, encoding)
+    if etag_matches(request, etag):
+        return not_modified_response(tag, cache_control)
+
+    key = (etag, encoding)
+    with _cache_lock:
+        hit = _compressed_cache.get(key)
+        if hit is not None:
+            _compressed_cache.move_to_end(key)
+    if hit is None:
+        hit = encode_body(render_json(build()), encoding)
+        with _cache_lock:
+            _compressed_cache[key] = hit
+            while len(_compressed_cache) > COMPRESSED_CACHE_MAX_ENTRIES:
+                _compressed_cache.popitem(last=False)
+
+    body, content_encoding = hit
+    headers = {"ETag": tag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def find_report(report_id: int) -> Dict[str, Any]:
     reps = load_reports()
-    reps.append(obj)
-    with open(REPORTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(reps, f, indent=2)
+    r = next((x for x in reps if x.get('id') == report_id), None)
+    if not r:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return r
+
+
+def load_report_template():
+    with open(TEMPLATE_FILE, "r", encoding="utf-8") as f:
+        source = f.read()
+    # the template hash is its version: editing report.html invalidates every cached render
+    return Template(source), hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
+
+
+REPORT_TEMPLATE, TEMPLATE_VERSION = load_report_template()
+_render_lock = threading.Lock()
+
+
+def _esc(value: Any) -> str:
+    return html.escape("" if value is None else str(value))
+
+
+def _items(values: Any) -> str:
+    if not isinstance(values, list):
+        values = [values] if values else []
+    return "".join(f"<li>{_esc(v)}</li>" for v in values)
+
+
+def _rows(mapping: Any) -> str:
+    if not isinstance(mapping, dict):
+        return ""
+    return "".join(f"<tr><td>{_esc(str(k).replace('_', ' '))}</td><td>{_esc(v)}</td></tr>" for k, v in mapping.items())
+
+
+def _resources(resources: Any) -> str:
+    out = []
+    for res in resources if isinstance(resources, list) else []:
+        if not isinstance(res, dict):
+            out.append(f"<li>{_esc(res)}</li>")
+            continue
+        url = str(res.get('url') or '')
+        title = _esc(res.get('title') or url)
+        if url.startswith(("http://", "https://")):
+            out.append(f'<li><a href="{_esc(url)}">{title}</a> — {_esc(url)}</li>')
+        else:
+            out.append(f"<li>{title}</li>")
+    return "".join(out)
+
+
+def render_report_html(report: Dict[str, Any]) -> bytes:
+    scores = report.get('scores') or {}
+    child = report.get('child') or {}
+    ai = report.get('ai_structured')
+    if not ai:
+        # older reports and failure-path reports have no ai_structured; rebuild it the way /assess would
+        answers = report.get('answers') or child.get('answers') or []
+        ai = synthesize_report(report.get('ai_parsed') or {}, scores, child, answers)
+    plan = ai.get('improvement_plan') if isinstance(ai.get('improvement_plan'), dict) else {}
+    follow_up = ai.get('follow_up') if isinstance(ai.get('follow_up'), dict) else {}
+    red_flags = scores.get('red_flags') or []
+    timestamp = report.get('timestamp')
+
+    return REPORT_TEMPLATE.substitute(
+        report_id=_esc(report.get('id')),
+        created=_esc(datetime.utcfromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M UTC") if timestamp else ""),
+        child_name=_esc(child.get('child_name') or "Unknown"),
+        child_age=_esc(child.get('child_age')),
+        # computed scores win over the model's own score/category, matching build_assess_response
+        score=_esc(scores.get('overall_score', ai.get('score'))),
+        category=_esc(scores.get('category', ai.get('category'))),
+        header_summary=_esc(ai.get('header_summary') or f"{scores.get('category', '')} — Score: {scores.get('overall_score', '')}"),
+        professional_paragraph=_esc(ai.get('professional_paragraph')),
+        red_flags=_esc(f"Red flags: {', '.join(red_flags)}" if red_flags else ""),
+        observations=_items(ai.get('observations')),
+        why_this_matters=_esc(ai.get('why_this_matters')),
+        pillars=_rows(scores.get('pillar_percentages')),
+        risks=_rows(scores.get('risks')),
+        plan_30=_items(plan.get('30_days') or plan.get('30')),
+        plan_60=_items(plan.get('60_days') or plan.get('60')),
+        plan_90=_items(plan.get('90_days') or plan.get('90')),
+        family_rules=_items(ai.get('recommended_family_rules')),
+        next_assessment=_esc(follow_up.get('next_assessment_date') or "—"),
+        consultant=_esc(follow_up.get('consultant_recommended') or "—"),
+        monitor_confidence=_esc(ai.get('monitor_confidence', "—")),
+        counselor_notes=_esc(ai.get('counselor_notes')),
+        resources=_resources(ai.get('suggested_resources')),
+    ).encode("utf-8")
+
+
+def render_cache_key(etag: str, fmt: str) -> str:
+    # content-addressed: report id + content hash (the ETag), template version and format
+    return hashlib.sha256(f"{etag}:{TEMPLATE_VERSION}:{fmt}".encode("utf-8")).hexdigest()
+
+
+def render_cache_path(key: str, fmt: str) -> str:
+    return os.path.join(RENDER_DIR, f"{key}.{fmt}")
+
+
+def read_render_cache(key: str, fmt: str) -> Optional[bytes]:
+    path = render_cache_path(key, fmt)
+    try:
+        with open(path, "rb") as f:
+            body = f.read()
+        # bump mtime so eviction treats it as recently used
+        os.utime(path)
+        return body
+    except OSError:
+        return None
+
+
+def write_render_cache(key: str, fmt: str, body: bytes):
+    os.makedirs(RENDER_DIR, exist_ok=True)
+    path = render_cache_path(key, fmt)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+    evict_render_cache()
+
+
+def evict_render_cache():
+    """Delete least recently used renders until the cache fits in RENDER_CACHE_MAX_BYTES."""
+    with _render_lock:
+        entries = []
+        for name in os.listdir(RENDER_DIR):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                st = os.stat(os.path.join(RENDER_DIR, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        total = sum(e[1] for e in entries)
+        for _, size, name in sorted(entries):
+            if total <= RENDER_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(os.path.join(RENDER_DIR, name))
+            except OSError:
+                pass
+            total -= size
+
+
+def rendered_report(report: Dict[str, Any], etag: str, fmt: str) -> bytes:
+    key = render_cache_key(etag, fmt)
+    body = read_render_cache(key, fmt)
+    if body is None:
+        body = render_report_html(report)
+        if fmt == "pdf":
+            body = WeasyHTML(string=body.decode("utf-8")).write_pdf()
+        write_render_cache(key, fmt, body)
+    return body
+
+
+def prerender_report(report: Dict[str, Any]):
+    """Background task run after save_report so the first download is already cached."""
+    etag = report_etag(report)
+    for fmt in RENDER_MEDIA_TYPES:
+        if fmt == "pdf" and WeasyHTML is None:
+            continue
+        try:
+            rendered_report(report, etag, fmt)
+        except Exception:
+            # not fatal: the render endpoint retries on request
+            pass
 
 
 def compute_scores(answers: List[Dict]) -> Dict[str, Any]:
@@ -276,9 +689,76 @@ def try_parse_ai_text_to_json(text: str):
         return None
 
 
+def _as_text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return ' '.join(t for t in (_as_text(v) for v in value) if t)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return str(value)
+
+
+def _as_text_list(value: Any) -> Optional[List[str]]:
+    if isinstance(value, str):
+        return [value] if value.strip() else None
+    if not isinstance(value, list):
+        return None
+    return [_as_text(v) or '' for v in value]
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        # tolerate "78%", "78/100", "about 78"
+        m = re.search(r"-?\d+(?:\.\d+)?", value)
+        if m:
+            return float(m.group(0))
+    return None
+
+
+def _as_resources(value: Any) -> Optional[List[Dict[str, str]]]:
+    if not isinstance(value, list):
+        return None
+    out = []
+    for res in value:
+        if isinstance(res, dict):
+            url = _as_text(res.get('url')) or ''
+            out.append({'title': _as_text(res.get('title')) or url, 'url': url})
+        elif isinstance(res, str) and res.strip():
+            out.append({'title': res, 'url': res if res.startswith(('http://', 'https://')) else ''})
+    return out
+
+
+def coerce_ai_fields(out: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce model-provided fields to the types AssessmentOut declares; anything unusable becomes None
+    so synthesize_report fills it with a default."""
+    for key in ('header_summary', 'professional_paragraph', 'why_this_matters', 'counselor_notes', 'category'):
+        if key in out:
+            out[key] = _as_text(out[key])
+    for key in ('observations', 'recommended_family_rules'):
+        if key in out:
+            out[key] = _as_text_list(out[key])
+    for key in ('monitor_confidence', 'score'):
+        if key in out:
+            out[key] = _as_number(out[key])
+    if 'improvement_plan' in out:
+        plan = out['improvement_plan']
+        out['improvement_plan'] = {str(k): _as_text_list(v) or [] for k, v in plan.items()} if isinstance(plan, dict) else None
+    if 'follow_up' in out and not isinstance(out['follow_up'], dict):
+        out['follow_up'] = None
+    if 'suggested_resources' in out:
+        out['suggested_resources'] = _as_resources(out['suggested_resources'])
+    # drop Nones so setdefault / "if not out.get(...)" below fill them
+    return {k: v for k, v in out.items() if v is not None}
+
+
 def synthesize_report(parsed: Dict[str, Any], scores: Dict[str, Any], child: Dict[str, Any], answers: List[Dict[str, Any]]):
     """Ensure all expected fields exist by synthesizing reasonable defaults when the model output is incomplete."""
-    out = {} if parsed is None else dict(parsed)
+    out = coerce_ai_fields({} if parsed is None else dict(parsed))
 
     overall = scores.get('overall_score', 0)
     category = scores.get('category', 'UNKNOWN')
@@ -445,14 +925,39 @@ def synthesize_report(parsed: Dict[str, Any], scores: Dict[str, Any], child: Dic
     return out
 
 
-@app.post("/assess")
-def assess(payload: AssessmentIn):
+def build_assess_response(scores: Dict[str, Any], final_ai: Dict[str, Any], ai: Dict[str, Any], include_raw: bool) -> Dict[str, Any]:
+    """/assess body: final_ai (synthesized full structure) plus scores; raw ai data only on request."""
+    response_obj = {
+        "score": scores['overall_score'],
+        "category": scores['category'],
+        "header_summary": final_ai.get('header_summary'),
+        "professional_paragraph": final_ai.get('professional_paragraph'),
+        "observations": final_ai.get('observations'),
+        "why_this_matters": final_ai.get('why_this_matters'),
+        "improvement_plan": final_ai.get('improvement_plan'),
+        "recommended_family_rules": final_ai.get('recommended_family_rules'),
+        "follow_up": final_ai.get('follow_up'),
+        "monitor_confidence": final_ai.get('monitor_confidence'),
+        "counselor_notes": final_ai.get('counselor_notes'),
+        "suggested_resources": final_ai.get('suggested_resources'),
+        "pillars": scores['pillar_percentages'],
+        "risks": scores['risks'],
+        "red_flags": scores['red_flags'],
+    }
+    if include_raw:
+        response_obj["raw_ai"] = ai
+    return AssessmentOut(**response_obj).dict(exclude_unset=True)
+
+
+@app.post("/assess", response_model=AssessmentOut, response_model_exclude_unset=True)
+def assess(payload: AssessmentIn, background_tasks: BackgroundTasks, include: Optional[str] = None):
     # compute derived scores
-    answers = [a.dict() for a in payload.answers]
+    child = payload.dict()
+    answers = child['answers']
     scores = compute_scores(answers)
 
     # build prompt and call model
-    summary = build_summary_payload(payload.dict(), answers)
+    summary = build_summary_payload(child, answers)
     try:
         ai = call_openrouter(summary)
     except HTTPException:
@@ -460,7 +965,7 @@ def assess(payload: AssessmentIn):
         report = {
             "id": int(time.time() * 1000),
             "timestamp": time.time(),
-            "child": payload.dict(),
+            "child": child,
             "scores": scores,
             "ai": None,
         }
@@ -476,33 +981,13 @@ def assess(payload: AssessmentIn):
             parsed_ai_json = {"narrative": ai['text']}
 
     # Ensure we have a full structured report by synthesizing missing fields
-    final_ai = synthesize_report(parsed_ai_json if isinstance(parsed_ai_json, dict) else {}, scores, payload.dict(), answers)
-
-    # response to frontend: prefer final_ai (synthesized full structure), but include raw ai data
-    response_obj = {
-        "score": scores['overall_score'],
-        "category": scores['category'],
-        "header_summary": final_ai.get('header_summary'),
-        "professional_paragraph": final_ai.get('professional_paragraph'),
-        "observations": final_ai.get('observations'),
-        "why_this_matters": final_ai.get('why_this_matters'),
-        "improvement_plan": final_ai.get('improvement_plan'),
-        "recommended_family_rules": final_ai.get('recommended_family_rules'),
-        "follow_up": final_ai.get('follow_up'),
-        "monitor_confidence": final_ai.get('monitor_confidence'),
-        "counselor_notes": final_ai.get('counselor_notes'),
-        "suggested_resources": final_ai.get('suggested_resources'),
-        "raw_ai": ai,
-        "pillars": scores['pillar_percentages'],
-        "risks": scores['risks'],
-        "red_flags": scores['red_flags'],
-    }
+    final_ai = synthesize_report(parsed_ai_json if isinstance(parsed_ai_json, dict) else {}, scores, child, answers)
 
     # Save full raw request/response
     report = {
         "id": int(time.time() * 1000),
         "timestamp": time.time(),
-        "child": payload.dict(),
+        "child": child,
         "answers": answers,
         "scores": scores,
         "ai_raw": ai,
@@ -510,28 +995,79 @@ def assess(payload: AssessmentIn):
         "ai_structured": final_ai,
     }
     save_report(report)
+    background_tasks.add_task(prerender_report, report)
 
-    return response_obj
+    # Returning the response directly skips FastAPI's jsonable_encoder pass;
+    # the body itself is validated through AssessmentOut in build_assess_response.
+    return FastJSONResponse(build_assess_response(scores, final_ai, ai, wants_raw(include)))
 
 
 @app.get("/reports")
-def get_reports():
-    reps = load_reports()
-    # return list with minimal metadata
-    out = [
-        {"id": r.get('id'), "timestamp": r.get('timestamp'), "child": r.get('child', {}).get('child_name'), "scores": r.get('scores')}
-        for r in reps
-    ]
-    return out
+def get_reports(request: Request):
+    etag = listing_etag()
+
+    def build():
+        reps = load_reports()
+        # return list with minimal metadata
+        return [
+            {"id": r.get('id'), "timestamp": r.get('timestamp'), "child": r.get('child', {}).get('child_name'), "scores": r.get('scores')}
+            for r in reps
+        ]
 
+    return cached_json_response(request, etag, LISTING_CACHE_CONTROL, build)
 
-@app.get("/reports/{report_id}")
-def get_report(report_id: int):
-    reps = load_reports()
-    r = next((x for x in reps if x.get('id') == report_id), None)
-    if not r:
+
+def build_report_response(r: Dict[str, Any], include_raw: bool) -> Dict[str, Any]:
+    view = r if include_raw else {k: v for k, v in r.items() if k != 'ai_raw'}
+    return ReportOut(**view).dict(exclude_unset=True)
+
+
+@app.get("/reports/{report_id}", response_model=ReportOut, response_model_exclude_unset=True)
+def get_report(report_id: int, request: Request, include: Optional[str] = None):
+    include_raw = wants_raw(include)
+
+    # reports are immutable: a known ETag is answered without touching storage
+    etag = known_report_etags().get(report_id)
+    if etag is None:
         raise HTTPException(status_code=404, detail="Report not found")
-    return r
+    if include_raw:
+        etag = raw_variant_etag(etag)
+
+    return cached_json_response(request, etag, REPORT_CACHE_CONTROL, lambda: build_report_response(find_report(report_id), include_raw))
+
+
+@app.get("/reports/{report_id}/render")
+def render_report(report_id: int, request: Request, fmt: str = Query("html", alias="format")):
+    fmt = fmt.lower()
+    if fmt not in RENDER_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'html' or 'pdf'")
+    if fmt == "pdf" and WeasyHTML is None:
+        raise HTTPException(status_code=501, detail="PDF rendering requires the weasyprint package on the server")
+
+    # a known report ETag lets a cached render (or a 304) be served without reading storage
+    etag = known_report_etags().get(report_id)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    key = render_cache_key(etag, fmt)
+    if etag_matches(request, f'"{key}"'):
+        return not_modified_response(f'"{key}"', REPORT_CACHE_CONTROL)
+    body = read_render_cache(key, fmt)
+    if body is None:
+        body = rendered_report(find_report(report_id), etag, fmt)
+
+    disposition = "inline" if fmt == "html" else "attachment"
+    headers = {
+        "ETag": f'"{key}"',
+        "Cache-Control": REPORT_CACHE_CONTROL,
+        "Content-Disposition": f'{disposition}; filename="cares-report-{report_id}.{fmt}"',
+    }
+    return Response(content=body, media_type=RENDER_MEDIA_TYPES[fmt], headers=headers)
+
+
+@app.on_event("startup")
+def warm_report_etags():
+    # one read at startup so conditional GETs after a restart don't touch storage
+    known_report_etags()
 
 
 @app.get("/health")
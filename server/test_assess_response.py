@@ -0,0 +1,49 @@
+"""/assess response typing: malformed model fields are coerced to AssessmentOut's types."""
+import json
+
+import main
+
+BODY = {"child_name": "A", "child_age": 10, "parent_contact": "x", "answers": [{"qid": 1, "option": "B"}]}
+
+
+def fake_model(monkeypatch, parsed):
+    monkeypatch.setattr(main, "call_openrouter", lambda prompt: {"raw": {"id": "x"}, "text": json.dumps(parsed)})
+
+
+def test_wrongly_typed_model_fields_are_coerced(client, monkeypatch):
+    fake_model(monkeypatch, {
+        "observations": "just a string",
+        "monitor_confidence": "78%",
+        "follow_up": "soon",
+        "suggested_resources": ["https://example.org", {"title": "Guide"}],
+        "improvement_plan": {"30_days": "one step"},
+    })
+    r = client.post("/assess", json=BODY)
+    assert r.status_code == 200
+    out = r.json()
+    assert out["observations"] == ["just a string"]
+    assert out["monitor_confidence"] == 78
+    assert set(out["follow_up"]) == {"next_assessment_date", "consultant_recommended"}
+    assert out["suggested_resources"] == [
+        {"title": "https://example.org", "url": "https://example.org"},
+        {"title": "Guide", "url": ""},
+    ]
+    assert out["improvement_plan"] == {"30_days": ["one step"]}
+    assert "raw_ai" not in out
+
+
+def test_raw_only_on_request(client, monkeypatch):
+    fake_model(monkeypatch, {})
+    assert client.post("/assess?include=raw", json=BODY).json()["raw_ai"]["raw"] == {"id": "x"}
+
+
+def test_failure_path_report_validates(client, monkeypatch):
+    def fail(prompt):
+        raise main.HTTPException(status_code=502, detail="down")
+    monkeypatch.setattr(main, "call_openrouter", fail)
+    assert client.post("/assess", json=BODY).status_code == 502
+
+    rid = main.load_reports()[0]["id"]
+    out = client.get(f"/reports/{rid}").json()
+    assert out["ai"] is None
+    assert "answers" not in out
@@ -0,0 +1,159 @@
+"""ETag / conditional GET / compression tests for the report endpoints.
+
+Run from the server/ folder:  python -m pytest -q
+"""
+import json
+import threading
+import time
+
+import pytest
+
+import main
+
+
+def make_report(report_id, padding=0):
+    return {
+        "id": report_id,
+        "timestamp": report_id / 1000,
+        "child": {"child_name": f"Child {report_id}", "child_age": 10, "parent_contact": "x"},
+        "answers": [{"qid": 1, "option": "B"}],
+        "scores": {
+            "pillar_percentages": {"E": 50.0, "DH": 60.0},
+            "overall_score": 55.0,
+            "category": "TRANSITION",
+            "red_flags": [],
+            "risks": {"cheating_risk": 40, "privacy_risk": 30},
+        },
+        "ai_raw": {"raw": {"pad": "x" * padding}, "text": "{}"},
+        "ai_parsed": {},
+        "ai_structured": {"header_summary": "Summary"},
+    }
+
+
+@pytest.fixture
+def initial_reports():
+    # the first report is large enough to be compressed, the second is not
+    return [make_report(1, padding=4000), make_report(2)]
+
+
+def no_storage_reads(monkeypatch):
+    def fail():
+        raise AssertionError("storage was read")
+    monkeypatch.setattr(main, "load_reports", fail)
+
+
+def test_listing_round_trip(client):
+    for encoding in ("identity", "gzip"):
+        r = client.get("/reports", headers={"accept-encoding": encoding})
+        assert r.status_code == 200
+        assert len(r.json()) == 2
+        etag = r.headers["etag"]
+
+        again = client.get("/reports", headers={"accept-encoding": encoding, "if-none-match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("path", ["/reports/1", "/reports/1?include=raw", "/reports/2", "/reports/2?include=raw"])
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+def test_report_round_trip_without_storage_read(client, monkeypatch, path, encoding):
+    r = client.get(path, headers={"accept-encoding": encoding})
+    assert r.status_code == 200
+    assert ("ai_raw" in r.json()) == path.endswith("include=raw")
+    assert r.headers["cache-control"] == main.REPORT_CACHE_CONTROL
+    etag = r.headers["etag"]
+    assert etag.endswith('-gzip"') == (encoding == "gzip")
+
+    no_storage_reads(monkeypatch)
+    again = client.get(path, headers={"accept-encoding": encoding, "if-none-match": etag})
+    assert again.status_code == 304
+    # a 304 carries the same ETag the 200 did
+    assert again.headers["etag"] == etag
+
+
+def test_raw_and_lean_etags_differ(client):
+    lean = client.get("/reports/1").headers["etag"]
+    raw = client.get("/reports/1?include=raw").headers["etag"]
+    assert lean != raw
+    assert client.get("/reports/1?include=raw", headers={"if-none-match": lean}).status_code == 200
+
+
+def test_large_bodies_are_gzipped(client):
+    r = client.get("/reports/1?include=raw", headers={"accept-encoding": "gzip"})
+    assert r.headers.get("content-encoding") == "gzip"
+    small = client.get("/reports/2", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.parametrize("header", ["gzip;q=0", "gzip; q=0.0", "br;q=0, gzip;q=0", "identity"])
+def test_refused_encodings_are_not_used(client, header):
+    r = client.get("/reports/1?include=raw", headers={"accept-encoding": header})
+    assert r.status_code == 200
+    assert "content-encoding" not in r.headers
+    assert r.json()["id"] == 1
+
+
+def test_partial_q_still_accepts_gzip(client):
+    r = client.get("/reports/1?include=raw", headers={"accept-encoding": "gzip; q=0.5"})
+    assert r.headers.get("content-encoding") == "gzip"
+
+
+def test_listing_etag_changes_after_save_report(client):
+    etag = client.get("/reports").headers["etag"]
+    main.save_report(make_report(3))
+
+    r = client.get("/reports", headers={"if-none-match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+    assert [x["id"] for x in r.json()] == [1, 2, 3]
+    assert client.get("/reports/3").status_code == 200
+
+
+def test_external_edit_invalidates_etags(client):
+    listing = client.get("/reports").headers["etag"]
+    report = client.get("/reports/2").headers["etag"]
+
+    edited = make_report(2)
+    edited["child"]["child_name"] = "Renamed outside the server"
+    with open(main.REPORTS_FILE, "w", encoding="utf-8") as f:
+        json.dump([edited], f)
+
+    assert client.get("/reports", headers={"if-none-match": listing}).status_code == 200
+    r = client.get("/reports/2", headers={"if-none-match": report})
+    assert r.status_code == 200
+    assert r.json()["child"]["child_name"] == "Renamed outside the server"
+    assert client.get("/reports/1").status_code == 404
+
+
+def test_unknown_report_is_404(client):
+    assert client.get("/reports/999").status_code == 404
+
+
+def test_concurrent_saves_keep_every_report_reachable(client, monkeypatch):
+    # warm the index so saves take the incremental path
+    assert client.get("/reports/1").status_code == 200
+
+    real_dump = main.json.dump
+
+    def slow_dump(*args, **kwargs):
+        # widen the window between reading, writing and updating the index
+        time.sleep(0.01)
+        real_dump(*args, **kwargs)
+
+    monkeypatch.setattr(main.json, "dump", slow_dump)
+    ids = list(range(10, 18))
+    barrier = threading.Barrier(len(ids))
+
+    def save(report_id):
+        barrier.wait()
+        main.save_report(make_report(report_id))
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert {r["id"] for r in main.load_reports()} >= set(ids)
+    for report_id in ids:
+        assert client.get(f"/reports/{report_id}").status_code == 200
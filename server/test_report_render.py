@@ -0,0 +1,82 @@
+"""Server-side report rendering: content type, fallback for reports without ai_structured, cache round trip."""
+import json
+import os
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def initial_reports():
+    failure_path_report = {
+        "id": 1,
+        "timestamp": 1.0,
+        "child": {"child_name": "Sam", "child_age": 9, "parent_contact": "x", "answers": [{"qid": 1, "option": "A"}]},
+        "scores": {
+            "pillar_percentages": {"E": 20.0, "DH": 80.0},
+            "overall_score": 35.0,
+            "category": "NOT READY",
+            "red_flags": ["Q1_cheating_high"],
+            "risks": {"cheating_risk": 90},
+        },
+        "ai": None,
+    }
+    return [failure_path_report]
+
+
+def test_html_render_falls_back_to_synthesized_fields(client):
+    r = client.get("/reports/1/render?format=html")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "text/html; charset=utf-8"
+    # observations and the 30/60/90 plan come from synthesize_report, not empty sections
+    assert "Strength: highest pillar DH at 80.0%." in r.text
+    assert "Set clear family AI rules" in r.text
+
+
+def test_render_round_trip(client):
+    etag = client.get("/reports/1/render").headers["etag"]
+    assert client.get("/reports/1/render", headers={"if-none-match": etag}).status_code == 304
+
+
+def test_bad_format_and_missing_report(client):
+    assert client.get("/reports/1/render?format=doc").status_code == 400
+    assert client.get("/reports/2/render").status_code == 404
+
+
+def test_computed_score_wins_over_model_score(client, monkeypatch):
+    reply = {"raw": {}, "text": json.dumps({"score": 99, "category": "AI-READY"})}
+    monkeypatch.setattr(main, "call_openrouter", lambda prompt: reply)
+    body = {"child_name": "A", "child_age": 10, "parent_contact": "x", "answers": [{"qid": 1, "option": "A"}]}
+    out = client.post("/assess", json=body).json()
+    assert (out["score"], out["category"]) != (99, "AI-READY")
+
+    rid = main.load_reports()[-1]["id"]
+    page = client.get(f"/reports/{rid}/render").text
+    assert f"<strong>{out['score']}</strong>{out['category']}" in page
+    assert "<strong>99</strong>" not in page
+
+
+def test_assess_prerenders_html_under_the_endpoint_key(client, monkeypatch):
+    monkeypatch.setattr(main, "call_openrouter", lambda prompt: {"raw": {}, "text": "{}"})
+    body = {"child_name": "A", "child_age": 10, "parent_contact": "x", "answers": [{"qid": 1, "option": "B"}]}
+    assert client.post("/assess", json=body).status_code == 200
+
+    rid = main.load_reports()[-1]["id"]
+    key = main.render_cache_key(main.known_report_etags()[rid], "html")
+    assert os.listdir(main.RENDER_DIR) == [f"{key}.html"]
+    # the endpoint serves that file as-is
+    assert client.get(f"/reports/{rid}/render").headers["etag"] == f'"{key}"'
+
+
+def test_eviction_keeps_recently_read_renders(client, monkeypatch):
+    monkeypatch.setattr(main, "RENDER_CACHE_MAX_BYTES", 250)
+    main.write_render_cache("old", "html", b"a" * 100)
+    main.write_render_cache("read", "html", b"b" * 100)
+    # make both look stale, "read" older than "old", then read it to bump its mtime
+    os.utime(main.render_cache_path("old", "html"), (2000, 2000))
+    os.utime(main.render_cache_path("read", "html"), (1000, 1000))
+    assert main.read_render_cache("read", "html") == b"b" * 100
+
+    main.write_render_cache("new", "html", b"c" * 100)
+    assert sorted(os.listdir(main.RENDER_DIR)) == ["new.html", "read.html"]